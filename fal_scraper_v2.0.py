@@ -7,13 +7,36 @@ from contextlib import asynccontextmanager
 import sys
 import math
 import re
+import json
+import importlib.util
 import logging
 from collections import defaultdict
 from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
 from openpyxl.comments import Comment
 from openpyxl.styles import PatternFill, Alignment, Font, numbers
-from openpyxl.formatting.rule import ColorScaleRule, CellIsRule
-from bs4 import BeautifulSoup
+from openpyxl.formatting.rule import ColorScaleRule, FormulaRule
+from bs4 import BeautifulSoup, SoupStrainer
+
+# Use orjson for faster JSON decoding if it's installed, fall back to the standard library otherwise
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    json_loads = json.loads
+
+# Use the C-based lxml parser for BeautifulSoup if it's installed, fall back to the built-in HTML parser otherwise
+html_parser = 'lxml' if importlib.util.find_spec('lxml') else 'html.parser'
+
+# Use ciso8601 for faster ISO 8601 timestamp parsing if it's installed, fall back to the standard library otherwise
+try:
+    from ciso8601 import parse_datetime
+except ImportError:
+    # Python 3.11+ parses a trailing 'Z' natively, older versions need it spelled out as an offset
+    if sys.version_info >= (3, 11):
+        parse_datetime = datetime.datetime.fromisoformat
+    else:
+        def parse_datetime(timestamp):
+            return datetime.datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
 
 # v v v v v SET USER VARIABLES HERE v v v v v
 
@@ -68,9 +91,12 @@ verbosity = 1  # Default: 1
 enable_logging = False  # Default: False
 
 # NETWORK SETTINGS
-# Limit concurrent asynchronous requests to avoid server-side throttling. Will not do much if your usage snapshots data in intervals of 6 minutes or greater. Will also not do much if you're fetching data for more than 10 titles at a time or have post data fetching enabled. Default value is practically unlimited
+# Limit concurrent asynchronous requests to avoid server-side throttling. Will not do much if your usage snapshots data in intervals of 6 minutes or greater. Will also not do much if you're fetching data for more than 10 titles at a time or have post data fetching enabled. Applies to forum requests as well as API calls. Default value is practically unlimited
 max_conc_requests = 9999  # Default: 9999
 
+# Limit open connections to a single host. Requests past the limit wait for a pooled connection to free up instead of opening new sockets, which keeps forum fetching from flooding MAL with hundreds of connections at once. Set to 0 for no limit
+max_conn_per_host = 10  # Default: 10
+
 # Number of attempts to retry a failed API or HTTP call
 retry_limit = 3  # Default: 3
 
@@ -104,19 +130,20 @@ failed_anime_ids = []
 # Set up the logic for verbosity levels
 def log_print(message, level=logging.INFO):
     global error_count
-    timestamp = datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-    
     if level == logging.ERROR:
         error_count += 1
 
+    # Nothing is printed or logged at verbosity 0, so skip the rest of the work entirely
     if verbosity == 0:
         return
-    elif verbosity == 1 and level >= logging.INFO:
-        print(f"{timestamp}: {message}")
-    elif verbosity == 2 and level >= VERBOSE:
-        print(f"{timestamp}: {message}")
-    elif verbosity >= 3:
-        print(f"{timestamp}: {logging.getLevelName(level)} - {message}")
+
+    # Format the timestamp only for messages that actually get printed
+    if verbosity >= 3 or level >= (logging.INFO if verbosity == 1 else VERBOSE):
+        timestamp = datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        if verbosity >= 3:
+            print(f"{timestamp}: {logging.getLevelName(level)} - {message}")
+        else:
+            print(f"{timestamp}: {message}")
     
     if logger:
         logger.log(level, message)
@@ -145,17 +172,22 @@ if not validate_anime_ids(anime_ids):
     log_print("Error: Anime IDs missing or invalid. Check the user variables section of the script.", level=logging.ERROR)
     sys.exit(1)
 
+# API URL templates and request headers, built once and reused by every request
+ANIME_API_URL = 'https://api.myanimelist.net/v2/anime/{}?fields=mean,num_favorites,statistics,status'
+FORUM_TOPIC_API_URL = 'https://api.myanimelist.net/v2/forum/topic/{}?offset={}&limit={}'
+API_HEADERS = {'X-MAL-CLIENT-ID': client_id}
+
 # Set up asynchronous data fetching with client-side throttling
 async def fetch_anime_data(session, anime_id, semaphore):
     async with semaphore:
-        url = f'https://api.myanimelist.net/v2/anime/{anime_id}?fields=mean,num_favorites,statistics,status'
-        headers = {'X-MAL-CLIENT-ID': client_id}
+        url = ANIME_API_URL.format(anime_id)
         attempts = max(1, retry_limit)  # Ensure at least one attempt is made
         for attempt in range(attempts):
             try:
-                async with session.get(url, headers=headers) as response:
+                async with session.get(url, headers=API_HEADERS) as response:
                     response.raise_for_status()
-                    return await response.json()
+                    # Decode the raw bytes directly, skipping the charset detection and str decoding step of response.json()
+                    return json_loads(await response.read())
             except ClientResponseError as e:
                 if e.status == 404:
                     log_print(f"Anime with ID {anime_id} not found (error 404)", level=logging.ERROR)
@@ -181,254 +213,295 @@ async def fetch_anime_data(session, anime_id, semaphore):
 # Ensure optimal usage of client sessions by using a context manager
 @asynccontextmanager
 async def get_session():
-    async with aiohttp.ClientSession(connector=aiohttp.TCPConnector(ssl=False)) as session:
+    # Cap connections per host and keep DNS results for the whole run, since every request goes to the same two hosts
+    connector = aiohttp.TCPConnector(ssl=False, limit_per_host=max_conn_per_host, ttl_dns_cache=300)
+    async with aiohttp.ClientSession(connector=connector) as session:
         yield session
 
-# Main asynchronous function to fetch data for all provided anime IDs
-async def main(anime_ids):
+# Keep only the fields read downstream so the rest of each payload can be freed right after parsing
+def extract_anime_fields(data):
+    # Coerce the ID, title, favorites and user counts once here so they flow through to the sheet without further casting
+    # Only the four counts used downstream are kept; null or missing ones count as 0
+    stats = (data.get('statistics') or {}).get('status') or {}
+    return {
+        'id': int(data['id']),
+        'title': str(data['title']),
+        'mean': data.get('mean'),
+        'num_favorites': int(data['num_favorites']),
+        'status': data.get('status', ''),
+        'statistics': {'status': {key: int(stats.get(key) or 0) for key in ('watching', 'completed', 'dropped', 'plan_to_watch')}}
+    }
+
+# Fetch data for all anime IDs in a list using the provided session
+async def fetch_all_anime_data(session, anime_ids, semaphore):
+    tasks = [fetch_anime_data(session, anime_id, semaphore) for anime_id in anime_ids]
+    responses = await asyncio.gather(*tasks)
+    # Create a dictionary mapping anime IDs to their data, leaving out failed fetches and malformed payloads
+    datas = {}
+    for anime_id, response in zip(anime_ids, responses):
+        if response is None:
+            continue
+        try:
+            datas[anime_id] = extract_anime_fields(response)
+        except (KeyError, TypeError, ValueError) as e:
+            log_print(f"Malformed data for anime ID {anime_id}: {str(e)}", level=logging.ERROR)
+    return datas
+
+# Main asynchronous function to fetch everything over a single session so that pooled connections are reused across all stages
+async def main(anime_ids, secondary_anime_ids):
     async with get_session() as session:
         semaphore = Semaphore(max_conc_requests)
-        tasks = [fetch_anime_data(session, anime_id, semaphore) for anime_id in anime_ids]
-        responses = await asyncio.gather(*tasks)
-        # Create a dictionary mapping anime IDs to their data (or None if fetch failed)
-        return {anime_id: response for anime_id, response in zip(anime_ids, responses) if response is not None}
+        fetches = [
+            fetch_all_anime_data(session, anime_ids, semaphore),
+            fetch_all_anime_data(session, secondary_anime_ids, semaphore)
+        ]
+        # Fetch forum data alongside the API data if enabled
+        if enable_posts:
+            fetches.append(fetch_forum_data(session, anime_ids, semaphore))
+        results = await asyncio.gather(*fetches)
+        forum_data = results[2] if enable_posts else []
+        return results[0], results[1], forum_data
 
 # Set up the Windows event loop policy to avoid errors if running on Windows
 if sys.platform.startswith('win'):
     asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
-
-# Run the asynchronous fetching for primary list, document the action
-log_print("Fetching API data...", logging.INFO)
-datas = asyncio.run(main(anime_ids))
-log_print(datas, logging.DEBUG)
-failed_anime_ids.extend([anime_id for anime_id in anime_ids if anime_id not in datas])
-
-# Run the asynchronous fetching for secondary list, if provided
-if secondary_anime_ids:
-    secondary_datas = asyncio.run(main(secondary_anime_ids))
-    log_print(secondary_datas, logging.DEBUG)
+# Elsewhere, use the faster libuv-based event loop if uvloop is installed
 else:
-    secondary_datas = []
-
-# Set up airing status codes and their respective fill colors
-def set_status_code_and_fill(cell, status_code):
-    status_colors = {
-        'NYA': 'E0E0E0',  # Light grey
-        'AIR': 'D8F2F2',  # Light blue
-        'PRE': 'FFD7AB',  # Sand yellow
-        'FIN': 'ABF1AB',  # Mint green
-        'FIN?': 'FF4D4D'  # Bright red
-    }
-    cell.value = status_code
-    cell.alignment = Alignment(horizontal='center')
-    if status_code in status_colors:
-        cell.fill = PatternFill(start_color=status_colors[status_code], end_color=status_colors[status_code], fill_type='solid')
-
-# Create and set up the output Excel file
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
+
+# Cell styles, created once and shared by every cell that uses them
+BOLD = Font(bold=True)
+CENTER = Alignment(horizontal='center')
+MAHOGANY = Font(color="640D0D")
+RED = Font(color="FF0000")
+HEADING = Font(size=18)
+
+# Set up airing status codes and their respective fill colors, created once and shared by every status cell
+STATUS_FILLS = {code: PatternFill(start_color=color, end_color=color, fill_type='solid') for code, color in {
+    'NYA': 'E0E0E0',  # Light grey
+    'AIR': 'D8F2F2',  # Light blue
+    'PRE': 'FFD7AB',  # Sand yellow
+    'FIN': 'ABF1AB',  # Mint green
+    'FIN?': 'FF4D4D'  # Bright red
+}.items()}
+
+# Return a styled status cell ready to be appended to a write-only sheet
+def create_status_cell(sheet, status_code):
+    cell = WriteOnlyCell(sheet, value=status_code)
+    cell.alignment = CENTER
+    fill = STATUS_FILLS.get(status_code)
+    if fill:
+        cell.fill = fill
+    return cell
+
+# Create and set up the output Excel file. Write-only mode streams rows straight to disk instead of keeping every cell in memory
 headers = ['Title', 'Score', 'Favorites', 'Posts', 'Watching', 'Completed', 'W+C', 'Dropped', 'Drop Rate', 'PTW', 'PTW Ratio', 'Status', 'ID']
-workbook = Workbook()
-main_sheet = workbook.active
-main_sheet.title = 'main'
+workbook = Workbook(write_only=True)
+main_sheet = workbook.create_sheet(title='main')
+if secondary_anime_ids:
+    alt_sheet = workbook.create_sheet(title='alt')
 
-# Calculate and process useful variables for logic and math operations below
-def calculate_variables(data):
-    stats = data.get('statistics', {}).get('status', {})
-    status = data.get('status', '')
-    watching = int(stats.get('watching', 0))  # Default to 0 if null/missing
-    completed = int(stats.get('completed', 0))  # \
-    dropped = int(stats.get('dropped', 0))      #  > Likewise
-    ptw = int(stats.get('plan_to_watch', 0))    # /
+# Add on-hover comments explaining columns and their formatting
+header_comments = {
+    'W+C': "Sum of watching and completed users. Ignores completed users if the series is not detected as completed, ignores both if the series is not detected as started.",
+    'Drop Rate': "Dropped users taken as a percentage of total dropped + watching + completed users.\nLower is better. Peak positive reached at 0.4% and below, peak negative at 10.0% and above, midpoint is at 3.8%.",
+    'PTW Ratio': "Ratio of watching + completed users to PTW users.\nHigher (hot) values suggest good conversion from potential to active audience.\nMidpoint is at 100%."
+}
 
+# Status detection heuristics, one per MAL airing status. Each returns the status code and the user counts with noise discarded
+def handle_not_yet_aired(watching, completed, dropped, ptw):
     # Set up heuristic for detecting early airings conflicting with MAL dates
     preair_noise_floor = math.ceil(200 + ptw // 250)
+    if watching < preair_noise_floor:
+        return 'NYA', 0, 0, 0
+    return 'PRE', watching, 0, dropped  # Mark as early preview
 
+def handle_finished_airing(watching, completed, dropped, ptw):
+    return 'FIN', watching, completed, dropped
+
+def handle_currently_airing(watching, completed, dropped, ptw):
     # Set up heuristic for detecting early endings conflicting with MAL dates
     comp_noise_floor = math.ceil(100 + watching / 30)
+    if completed < comp_noise_floor:
+        return 'AIR', watching, 0, dropped
+    return 'FIN?', watching, completed, dropped  # Mark as assumed finished
+
+def handle_unknown(watching, completed, dropped, ptw):
+    return 'UNK', watching, completed, dropped  # Unknown status; shouldn't ever happen
+
+STATUS_HANDLERS = {
+    'not_yet_aired': handle_not_yet_aired,
+    'finished_airing': handle_finished_airing,
+    'currently_airing': handle_currently_airing
+}
+
+# Processed variables for each record, keyed by object identity so sorting and populating the sheet calculate them only once
+calculated_variables = {}
+
+# Calculate and process useful variables for logic and math operations below
+def calculate_variables(data):
+    cached = calculated_variables.get(id(data))
+    if cached is not None:
+        return cached
+    stats = data.get('statistics', {}).get('status', {})
+    status = data.get('status', '')
+    watching = stats.get('watching', 0)  # Default to 0 if missing
+    completed = stats.get('completed', 0)  # \
+    dropped = stats.get('dropped', 0)      #  > Likewise
+    ptw = stats.get('plan_to_watch', 0)    # /
 
     # Apply status detection heuristics and discard all noise
-    if status == 'not_yet_aired':
-        if watching < preair_noise_floor:
-            watching, completed, dropped = 0, 0, 0
-            status_code = 'NYA'
-        else:
-            completed = 0
-            status_code = 'PRE'  # Mark as early preview
-    elif status == 'finished_airing':
-        status_code = 'FIN'
-    elif status == 'currently_airing':
-        if completed < comp_noise_floor:
-            completed = 0
-            status_code = 'AIR'
-        else:
-            status_code = 'FIN?'  # Mark as assumed finished
-    else:
-        status_code = 'UNK'  # Unknown status; shouldn't ever happen
+    status_code, watching, completed, dropped = STATUS_HANDLERS.get(status, handle_unknown)(watching, completed, dropped, ptw)
 
     # Calculate and return processed values
     watch_comp = watching + completed
     watch_drop = watch_comp + dropped
     active_ratio = watch_comp / ptw if ptw > 0 else 0.00
-    return status_code, watching, completed, dropped, ptw, watch_comp, watch_drop, active_ratio
-
-# Sheet sorting logic
+    drop_rate = dropped / watch_drop if watch_drop > 0 else 0.00  # Avoid division-by-zero errors
+    result = status_code, watching, completed, dropped, ptw, watch_comp, watch_drop, active_ratio, drop_rate
+    calculated_variables[id(data)] = result
+    return result
+
+# Sort keys for every column but Title, taking a valid record and returning a value that sorts in the desired order
+STATUS_ORDER = {'FIN': 0, 'FIN?': 1, 'AIR': 2, 'PRE': 3, 'NYA': 4, 'ERR': 5}
+SORT_KEYS = {
+    'B': lambda x: (x['mean'] is None, -(x['mean'] or 0)),  # Score: higher to lower to null
+    'C': lambda x: -x['num_favorites'],                     # Favorites: higher to lower
+    'D': lambda x: -post_counts.get(x['id'], 0),            # Posts: higher to lower
+    'E': lambda x: -calculate_variables(x)[1],              # Watching: higher to lower
+    'F': lambda x: -calculate_variables(x)[2],              # Completed: higher to lower
+    'G': lambda x: -calculate_variables(x)[5],              # W+C: higher to lower
+    'H': lambda x: -calculate_variables(x)[3],              # Dropped: higher to lower
+    'I': lambda x: -calculate_variables(x)[8],              # Drop Rate: higher to lower
+    'J': lambda x: -calculate_variables(x)[4],              # PTW: higher to lower
+    'K': lambda x: -calculate_variables(x)[7],              # PTW Ratio: higher to lower
+    'L': lambda x: STATUS_ORDER.get(calculate_variables(x)[0], 4),  # Status: FIN > FIN? > AIR > PRE > NYA > ERR
+    'M': lambda x: x['id']                                  # ID: lower to higher
+}
+
+# Sheet sorting logic. Each record is decorated with its key once, so the sort itself only compares plain tuples
 def sort_data(datas, sort_column):
-    # Helper function to get a sortable value
-    def get_sortable_value(x, key):
-        if isinstance(x, str):  # Error message
-            return float('inf')  # Ensure error messages are at the bottom
-        return x.get(key, float('inf'))
-
-    if sort_column == 'A':    # Title: alphabetic, A to Z
-        return sorted(datas.values(), key=lambda x: x if isinstance(x, str) else x['title'].lower())
-    elif sort_column == 'B':  # Score: higher to lower to null
-        return sorted(datas.values(), key=lambda x: (isinstance(x, str), -get_sortable_value(x, 'mean') if not isinstance(x, str) else 0))
-    elif sort_column == 'C':  # Favorites: higher to lower
-        return sorted(datas.values(), key=lambda x: (isinstance(x, str), -get_sortable_value(x, 'num_favorites')))
-    elif sort_column == 'D':  # Posts: higher to lower
-        return sorted(datas.values(), key=lambda x: (isinstance(x, str), -post_counts.get(int(x['id']), 0) if not isinstance(x, str) else 0))
-    elif sort_column == 'E':  # Watching: higher to lower
-        return sorted(datas.values(), key=lambda x: (isinstance(x, str), -calculate_variables(x)[1] if not isinstance(x, str) else 0))
-    elif sort_column == 'F':  # Completed: higher to lower
-        return sorted(datas.values(), key=lambda x: (isinstance(x, str), -calculate_variables(x)[2] if not isinstance(x, str) else 0))
-    elif sort_column == 'G':  # W+C: higher to lower
-        return sorted(datas.values(), key=lambda x: (isinstance(x, str), -calculate_variables(x)[5] if not isinstance(x, str) else 0))
-    elif sort_column == 'H':  # Dropped: higher to lower
-        return sorted(datas.values(), key=lambda x: (isinstance(x, str), -calculate_variables(x)[3] if not isinstance(x, str) else 0))
-    elif sort_column == 'I':  # Drop Rate: higher to lower
-        return sorted(datas.values(), key=lambda x: (isinstance(x, str), -(calculate_variables(x)[3] / calculate_variables(x)[6]) if not isinstance(x, str) and calculate_variables(x)[6] > 0 else 0))
-    elif sort_column == 'J':  # PTW: higher to lower
-        return sorted(datas.values(), key=lambda x: (isinstance(x, str), -calculate_variables(x)[4] if not isinstance(x, str) else 0))
-    elif sort_column == 'K':  # PTW Ratio: higher to lower
-        return sorted(datas.values(), key=lambda x: (isinstance(x, str), -calculate_variables(x)[7] if not isinstance(x, str) else 0))
-    elif sort_column == 'L':  # Status: FIN > FIN? > AIR > PRE > NYA > ERR
-        status_order = {'FIN': 0, 'FIN?': 1, 'AIR': 2, 'PRE': 3, 'NYA': 4, 'ERR': 5}
-        return sorted(datas.values(), key=lambda x: (isinstance(x, str), status_order.get(calculate_variables(x)[0], 4) if not isinstance(x, str) else 5))
-    elif sort_column == 'M':  # ID: lower to higher
-        return sorted(datas.values(), key=lambda x: (isinstance(x, str), int(x['id']) if not isinstance(x, str) else float('inf')))
-
-    # If no valid sort column is specified, return the original data
-    return list(datas.values())
-
-# Function to populate the main sheet with collected data
-def populate_sheet(sheet, datas):
-    # Format and freeze the headers and first column
-    for i, header in enumerate(headers):
-        cell = sheet.cell(1, i + 1, value=header)
-        cell.alignment = Alignment(horizontal='center')
-        cell.font = Font(bold=True)
-    sheet.freeze_panes = 'B2'
-
-    # Populate data columns
-    for j, data in enumerate(datas):
-        if isinstance(data, str):
-            # Write error message in all cells for this row
-            for col in range(1, len(headers) + 1):
-                cell = sheet.cell(j + 2, col, value=data)
-                cell.font = Font(color="FF0000")  # Make text red
-            continue
+    records = list(datas.values())
+    if sort_column == 'A':  # Title: alphabetic, A to Z
+        keyed = [(x if isinstance(x, str) else x['title'].lower(), i) for i, x in enumerate(records)]
+    elif sort_column in SORT_KEYS:
+        key = SORT_KEYS[sort_column]
+        # Error messages go to the bottom; the index breaks ties so records themselves are never compared
+        keyed = [(True, 0, i) if isinstance(x, str) else (False, key(x), i) for i, x in enumerate(records)]
+    else:
+        # If no valid sort column is specified, return the original data
+        return records
+    keyed.sort()
+    return [records[entry[-1]] for entry in keyed]
+
+# Extract the values for one row of the main sheet, in column order
+def get_row_values(data, post_counts):
+    # Extract processed values from calculate_variables()
+    try:
+        status_code, watching, completed, dropped, ptw, watch_comp, _, active_ratio, drop_rate = calculate_variables(data)
+    except Exception as e:
+        log_print(f"Error calculating variables for anime {data['title']}: {str(e)}", level=logging.ERROR)
+        status_code, watching, completed, dropped, ptw, watch_comp, _, active_ratio, drop_rate = ("ERR", 0, 0, 0, 0, 0, 0, 0, 0)
+    anime_id = data['id']
+    return (
+        data['title'], data.get("mean") or ' ', data['num_favorites'], post_counts.get(anime_id, 0),
+        watching, completed, watch_comp, dropped, drop_rate,
+        ptw, active_ratio, status_code, anime_id
+    )
 
-        sheet.cell(j + 2, 1, value=str(data['title']))
-        sheet.cell(j + 2, 2, value=data.get("mean") or ' ').number_format = numbers.FORMAT_NUMBER_00
-        sheet.cell(j + 2, 3, value=int(data['num_favorites']))
-        # Initialize the 'Posts' column to be filled conditionally
-        sheet.cell(j + 2, 4, value=0)
-        # Extract processed values from calculate_variables()
-        try:
-            status_code, watching, completed, dropped, ptw, watch_comp, watch_drop, active_ratio = calculate_variables(data)
-        except Exception as e:
-            log_print(f"Error calculating variables for anime {data['title']}: {str(e)}", level=logging.ERROR)
-            status_code, watching, completed, dropped, ptw, watch_comp, watch_drop, active_ratio = ("ERR", 0, 0, 0, 0, 0, 0, 0)
-        sheet.cell(j + 2, 5, value=watching)
-        sheet.cell(j + 2, 6, value=completed)
-        sheet.cell(j + 2, 7, value=watch_comp)
-        sheet.cell(j + 2, 8, value=dropped)
-        # Avoid division-by-zero errors
-        sheet.cell(j + 2, 9, value=dropped / watch_drop if watch_drop > 0 else 0).number_format = numbers.FORMAT_PERCENTAGE_00
-        sheet.cell(j + 2, 10, value=ptw)
-        sheet.cell(j + 2, 11, value=active_ratio).number_format = numbers.FORMAT_PERCENTAGE_00
-        # Invoke the airing status heuristic to help determine the status
-        status_cell = sheet.cell(j + 2, 12)
-        set_status_code_and_fill(status_cell, status_code)
-        sheet.cell(j + 2, 13, value=int(data['id'])).alignment = Alignment(horizontal='center')
+# Function to populate the main sheet with collected data. In write-only mode every cell has to be fully formatted before its row is appended
+def populate_sheet(sheet, datas, post_counts):
+    # Hide columns based on user variables; column settings must be in place before the first row is written
+    # Always hide Posts on the alt sheet since we aren't populating it
+    hide_posts = not enable_posts or sheet.title == 'alt'
+    for column, hide in zip('DEFM', (hide_posts, hide_watching, hide_completed, hide_id)):
+        if hide:
+            sheet.column_dimensions[column].hidden = True
 
     # Double the width of title column for better legibility by default
     sheet.column_dimensions['A'].width = 2 * sheet.column_dimensions['A'].width
 
-# Sort the data before populating the sheet
-sorted_datas = sort_data(datas, sort_column)
-
-# Populate the main sheet
-log_print("Populating the spreadsheet...", logging.INFO)
-populate_sheet(main_sheet, sorted_datas)
-# Populate the secondary sheet if secondary IDs are provided
-if secondary_anime_ids:
-    alt_sheet = workbook.create_sheet(title='alt')
-    secondary_datas = sort_data(secondary_datas, sort_column)
-    populate_sheet(alt_sheet, secondary_datas)
-
-# Define conditional formatting and column hiding
-def apply_conditional_formatting(sheet):
-    green_fill = PatternFill(start_color='548235', end_color='548235', fill_type='solid')
-    red_fill = PatternFill(start_color='C00000', end_color='C00000', fill_type='solid')
-    # Column I fill goes from green (≤0.4%) to white (3.8%) to red (≥10%)
-    color_rule_i = ColorScaleRule(start_type='num', start_value=0.004, start_color='548235', mid_type='num', mid_value=0.038, mid_color='FFFFFF', end_type='num', end_value=0.1, end_color='C00000')
-    sheet.conditional_formatting.add('I2:I101', color_rule_i)
-    sheet.conditional_formatting.add('I2:I101', CellIsRule(operator='greaterThanOrEqual', formula=['0.1'], fill=red_fill))
-
-    # Color text in columns E, F, G mahogany if ace cap is reached
-    for row in sheet.iter_rows(min_row=2, max_row=sheet.max_row, min_col=5, max_col=7):
-        for cell in row:
-            if cell.value is not None and isinstance(cell.value, (int, float)) and cell.value >= ace_cap:
-                cell.font = Font(color="640D0D")
-
-    # Skip empty cells and zero values
-    for row in sheet.iter_rows(min_row=2, max_row=sheet.max_row, min_col=9, max_col=9):
-        for cell in row:
-            if cell.value is not None and isinstance(cell.value, (int, float)) and cell.value > 0:
-                sheet.conditional_formatting.add(cell.coordinate, CellIsRule(operator='lessThanOrEqual', formula=['0.004'], fill=green_fill))
-
-    # Column K goes from deep blue (lowest) to white (100%) to red (highest)
-    color_rule_k = ColorScaleRule(start_type='min', start_color='1874A5', end_type='max', end_color='C00000', mid_type='num', mid_value=1.0, mid_color='FFFFFF')
-    sheet.conditional_formatting.add('K2:K101', color_rule_k)
-
-    # Add on-hover comments explaining columns and their formatting
-    sheet['G1'].comment = Comment("Sum of watching and completed users. Ignores completed users if the series is not detected as completed, ignores both if the series is not detected as started.", " ")
-    sheet['G1'].comment.width = None
-    sheet['I1'].comment = Comment("Dropped users taken as a percentage of total dropped + watching + completed users.\nLower is better. Peak positive reached at 0.4% and below, peak negative at 10.0% and above, midpoint is at 3.8%.", " ")
-    sheet['I1'].comment.width = None
-    sheet['K1'].comment = Comment("Ratio of watching + completed users to PTW users.\nHigher (hot) values suggest good conversion from potential to active audience.\nMidpoint is at 100%.", " ")
-    sheet['K1'].comment.width = None
-
-    # Hide columns based on user variables
-    if not enable_posts:
-        sheet.column_dimensions['D'].hidden = True
-    if hide_watching:
-        sheet.column_dimensions['E'].hidden = True
-    if hide_completed:
-        sheet.column_dimensions['F'].hidden = True
-    if hide_id:
-        sheet.column_dimensions['M'].hidden = True
-    # Always hide Posts on the alt sheet since we aren't populating it
-    if sheet.title == 'alt':
-        sheet.column_dimensions['D'].hidden = True
+    # Format and freeze the headers and first column
+    sheet.freeze_panes = 'B2'
+    header_row = []
+    for header in headers:
+        cell = WriteOnlyCell(sheet, value=header)
+        cell.alignment = CENTER
+        cell.font = BOLD
+        if header in header_comments:
+            cell.comment = Comment(header_comments[header], " ")
+            cell.comment.width = None
+        header_row.append(cell)
+    sheet.append(header_row)
+
+    # Compute all row values up front so the loop below only formats cells and appends rows
+    rows = [data if isinstance(data, str) else get_row_values(data, post_counts) for data in datas]
+
+    # Populate data rows, building each row in full and appending it in one pass
+    for row in rows:
+        if isinstance(row, str):
+            # Write error message in all cells for this row
+            error_row = []
+            for _ in headers:
+                cell = WriteOnlyCell(sheet, value=row)
+                cell.font = RED  # Make text red
+                error_row.append(cell)
+            sheet.append(error_row)
+            continue
 
-# Apply conditional formatting to relevant sheets
-apply_conditional_formatting(main_sheet)
-if secondary_datas:
-    apply_conditional_formatting(alt_sheet)
+        title, score, favorites, posts, watching, completed, watch_comp, dropped, drop_rate, ptw, active_ratio, status_code, anime_id = row
+        score_cell = WriteOnlyCell(sheet, value=score)
+        score_cell.number_format = numbers.FORMAT_NUMBER_00
+        drop_rate_cell = WriteOnlyCell(sheet, value=drop_rate)
+        drop_rate_cell.number_format = numbers.FORMAT_PERCENTAGE_00
+        active_ratio_cell = WriteOnlyCell(sheet, value=active_ratio)
+        active_ratio_cell.number_format = numbers.FORMAT_PERCENTAGE_00
+        # Invoke the airing status heuristic to help determine the status
+        status_cell = create_status_cell(sheet, status_code)
+        id_cell = WriteOnlyCell(sheet, value=anime_id)
+        id_cell.alignment = CENTER
+
+        sheet.append([
+            title, score_cell, favorites, posts,
+            watching, completed, watch_comp, dropped, drop_rate_cell,
+            ptw, active_ratio_cell, status_cell, id_cell
+        ])
+
+# Conditional formatting rules, created once and shared by every sheet
+# Column I fill goes from green (≤0.4%) to white (3.8%) to red (≥10%); values past either end stop take that stop's color
+COLOR_RULE_I = ColorScaleRule(start_type='num', start_value=0.004, start_color='548235', mid_type='num', mid_value=0.038, mid_color='FFFFFF', end_type='num', end_value=0.1, end_color='C00000')
+# Column K goes from deep blue (lowest) to white (100%) to red (highest)
+COLOR_RULE_K = ColorScaleRule(start_type='min', start_color='1874A5', end_type='max', end_color='C00000', mid_type='num', mid_value=1.0, mid_color='FFFFFF')
+# Color text in columns E, F, G mahogany if ace cap is reached. Excel ranks text above any number, so skip the error rows explicitly
+ACE_RULE = FormulaRule(formula=[f'AND(ISNUMBER(E2),E2>={ace_cap})'], font=MAHOGANY)
+
+# Define conditional formatting, sizing every range to the rows actually written
+def apply_conditional_formatting(sheet, row_count):
+    last_row = max(2, row_count + 1)
+    sheet.conditional_formatting.add(f'I2:I{last_row}', COLOR_RULE_I)
+    sheet.conditional_formatting.add(f'K2:K{last_row}', COLOR_RULE_K)
+    sheet.conditional_formatting.add(f'E2:G{last_row}', ACE_RULE)
+
+# Fixed UTC and UTC+2 (FAL timezone) offsets, created once and reused for every timestamp
+UTC = datetime.timezone.utc
+FAL_TZ = datetime.timezone(datetime.timedelta(hours=2))
 
 # Set UTC+2 (FAL timezone) as the working timezone
-now = datetime.datetime.now(datetime.timezone.utc) + datetime.timedelta(hours=2)
+now = datetime.datetime.now(UTC) + datetime.timedelta(hours=2)
 
 # Determine TV season boundaries based on the first week of the year
 def get_season_start(year, season_start_override, season_override):
     if season_start_override and season_override:
          # Parse the override date and enforce UTC+2
         override_date = datetime.datetime.strptime(season_start_override, '%Y-%m-%d')
-        return {season_override: override_date.replace(tzinfo=datetime.timezone.utc) + datetime.timedelta(hours=2)}
+        return {season_override: override_date.replace(tzinfo=UTC) + datetime.timedelta(hours=2)}
     else:
         # Week 1 to start on the Monday of the week containing 4 Jan
-        iso_year_start = datetime.datetime(year, 1, 4, tzinfo=datetime.timezone.utc)
+        iso_year_start = datetime.datetime(year, 1, 4, tzinfo=UTC)
         iso_week_start = iso_year_start - datetime.timedelta(days=iso_year_start.weekday())
         # Divide the year into programming seasons by counting weeks
         season_week_starts = {
@@ -479,6 +552,9 @@ if current_period == 2:
 else:
     current_period_start = season_start + datetime.timedelta(weeks=(current_period - 2))
 current_period_end = season_start + datetime.timedelta(weeks=current_period)
+# Unix epoch equivalents of the boundaries, so post timestamps can be compared as plain integers
+current_period_start_ts = int(current_period_start.timestamp())
+current_period_end_ts = int(current_period_end.timestamp())
 
 # Print resulting calculations for debugging purposes
 log_print(f"Current week: {current_week}", logging.DEBUG)
@@ -486,8 +562,11 @@ log_print(f"Current period: {current_period}", logging.DEBUG)
 log_print(f"Current period start: {current_period_start}", logging.DEBUG)
 log_print(f"Current period end: {current_period_end}", logging.DEBUG)
 
+# Match episode discussion thread titles and capture the episode number; compiled once for all calls
+EPISODE_RE = re.compile(r'Episode (\d+) Discussion', re.IGNORECASE)
+
 # Fetch forum data for a given ID
-async def fetch_forum_threads(session, anime_id):
+async def fetch_forum_threads(session, anime_id, semaphore):
     # Start by accessing the episode discussion subforum keyed to anime ID
     base_url = 'https://myanimelist.net/forum/?animeid={}&topic=episode'
     full_base_url = 'https://myanimelist.net{}'
@@ -496,17 +575,17 @@ async def fetch_forum_threads(session, anime_id):
     
     for attempt in range(max(1, retry_limit)):
         try:
-            async with session.get(url) as response:
+            # Hold a request slot only while the request is in flight, never while waiting to retry
+            async with semaphore, session.get(url) as response:
                 if response.status != 200:
                     raise Exception(f"Failed to fetch {url} with status code: {response.status}")
                 
                 log_print(f"Successfully fetched data for anime_id: {anime_id}", logging.DEBUG)
         
                 text = await response.text()
-                soup = BeautifulSoup(markup=text, features='html.parser')
+                soup = BeautifulSoup(markup=text, features=html_parser)
                 thread_data = []
                 # Parse for discussion threads and note the episode number
-                pattern = re.compile(r'Episode (\d+) Discussion', re.IGNORECASE)
                 threads = soup.find_all('td', class_='forum_boardrow1')
                 
                 log_print(f"Number of threads found: {len(threads)}", logging.DEBUG)
@@ -519,11 +598,12 @@ async def fetch_forum_threads(session, anime_id):
                     if thread.get('align') == 'right':
                         continue
                         
-                    a_tag = thread.find('a', string=pattern)
+                    a_tag = thread.find('a', string=EPISODE_RE)
                     if a_tag:
-                        episode_number = pattern.search(a_tag.text).group(1)
+                        episode_number = EPISODE_RE.search(a_tag.text).group(1)
                         thread_url = full_base_url.format(a_tag['href'])
-                        reply_count_tag = thread.find_next('td')
+                        # The reply count sits in the next cell of the same row, so only the row's siblings need checking
+                        reply_count_tag = thread.find_next_sibling('td')
                         
                         if reply_count_tag:
                             reply_count = int(reply_count_tag.text.strip())
@@ -534,9 +614,11 @@ async def fetch_forum_threads(session, anime_id):
                             'anime_id': anime_id,
                             'episode_number': int(episode_number),
                             'thread_url': thread_url,
+                            'topicid': a_tag['href'].rsplit('=', 1)[-1],  # Keep the topic ID for the forum API calls
                             'reply_count': reply_count
                         })
-                    else:
+                    # Serializing the row's HTML is costly, so only do it when verbose output is shown
+                    elif verbosity >= 2:
                         log_print(f"No matching discussion thread found in this row: {thread}", VERBOSE)
                 log_print(f"Number of thread_data entries: {len(thread_data)}", logging.DEBUG)
                 return thread_data
@@ -549,30 +631,36 @@ async def fetch_forum_threads(session, anime_id):
     return []
 
 # Function to fetch pages
-async def fetch_page(session, url, headers):
+async def fetch_page(session, url, headers, semaphore):
     for attempt in range(max(1, retry_limit)):
         try:
-            async with session.get(url, headers=headers) as response:
+            # Hold a request slot only while the request is in flight, never while waiting to retry
+            async with semaphore, session.get(url, headers=headers) as response:
                 log_print(f"Attempt {attempt + 1}: Status code {response.status} for URL: {url}", VERBOSE)
                 if response.status == 403:
                     log_print(f"Access denied for {url} with status code: {response.status}. Retrying...", VERBOSE)
-                    await asyncio.sleep(1)
-                    continue
                 elif response.status != 200:
                     log_print(f"Failed to fetch {url} with status code: {response.status}", logging.ERROR)
-                    response_text = await response.text()
-                    log_print(f"Response text: {response_text}", logging.DEBUG)
+                    # Only read and dump the response body when debug output is enabled
+                    if verbosity >= 3:
+                        response_text = await response.text()
+                        log_print(f"Response text: {response_text}", logging.DEBUG)
                     raise Exception(f"Failed to fetch {url} with status code: {response.status}")
-                
-                response_text = await response.text()
-                log_print(f"Response text: {response_text}", logging.DEBUG)
-                try:
-                    json_response = await response.json()
-                    return json_response
-                except json.JSONDecodeError as json_error:
-                    log_print(f"Failed to decode JSON from response: {str(json_error)}", logging.ERROR)
-                    log_print(f"Raw response: {response_text}", logging.DEBUG)
-                    raise
+                else:
+                    # Decode the raw bytes directly; the body is only turned into text when debug output needs it
+                    response_body = await response.read()
+                    if verbosity >= 3:
+                        log_print(f"Response text: {response_body.decode('utf-8', errors='replace')}", logging.DEBUG)
+                    try:
+                        json_response = json_loads(response_body)
+                        return json_response
+                    except json.JSONDecodeError as json_error:
+                        log_print(f"Failed to decode JSON from response: {str(json_error)}", logging.ERROR)
+                        if verbosity >= 3:
+                            log_print(f"Raw response: {response_body.decode('utf-8', errors='replace')}", logging.DEBUG)
+                        raise
+            # Only an access denied response gets here; wait a moment before retrying
+            await asyncio.sleep(1)
         except Exception as e:
             log_print(f"Error fetching {url}: {str(e)}", logging.ERROR)
             if attempt == max(0, retry_limit - 1):
@@ -582,22 +670,21 @@ async def fetch_page(session, url, headers):
     return None
 
 # Fetch text contents of a thread via API in batches
-async def fetch_thread_details(session, topicid, batch_size=100):
-    base_url = f'https://api.myanimelist.net/v2/forum/topic/{topicid}'
-    headers = {'X-MAL-CLIENT-ID': client_id}
+async def fetch_thread_details(session, topicid, semaphore, batch_size=100):
     log_print(f"Using client ID: {'*' * (len(client_id) - 4) + client_id[-4:]}", logging.DEBUG)
     thread_details = []
     offset = 0
 
     while True:
-        url = f"{base_url}?offset={offset}&limit={batch_size}"
+        url = FORUM_TOPIC_API_URL.format(topicid, offset, batch_size)
         log_print(f"Fetching thread details from {url}", VERBOSE)
-        response = await fetch_page(session, url, headers)
+        response = await fetch_page(session, url, API_HEADERS, semaphore)
         if response is None:
             log_print(f"No response received for topicid {topicid}", logging.ERROR)
             break
 
-        log_print(f"Response for topicid {topicid}: {response}", logging.DEBUG)
+        if verbosity >= 3:
+            log_print(f"Response for topicid {topicid}: {response}", logging.DEBUG)
 
         posts = response.get('data', {}).get('posts', [])
         if not posts:
@@ -608,8 +695,9 @@ async def fetch_thread_details(session, topicid, batch_size=100):
             created_at = post.get('created_at')
             created_by = post.get('created_by', {}).get('name')
             if created_at and created_by:
-                timestamp = datetime.datetime.fromisoformat(created_at.replace('Z', '+00:00')).astimezone(datetime.timezone(datetime.timedelta(hours=2)))
-                thread_details.append({'username': created_by, 'timestamp': timestamp.isoformat()})
+                # Store the post time as a Unix epoch integer; it's only formatted as a date when written to the sheet
+                timestamp = int(parse_datetime(created_at).timestamp())
+                thread_details.append({'username': created_by, 'timestamp': timestamp})
             else:
                 log_print(f"Incomplete post data for topicid {topicid}: {post}", logging.WARNING)
 
@@ -621,23 +709,37 @@ async def fetch_thread_details(session, topicid, batch_size=100):
         else:
             break
     
-    log_print(f"Thread details for topicid {topicid}: {thread_details}", logging.DEBUG)
+    if verbosity >= 3:
+        log_print(f"Thread details for topicid {topicid}: {thread_details}", logging.DEBUG)
     return thread_details
 
+# Keep post message divs and date divs when parsing last post pages. Class values are matched by their tokens, since the parser may hand over the raw attribute string
+POST_MESSAGE_CLASSES = {'forum-topic-message', 'message', 'individual'}
+def is_post_message_or_date(class_value):
+    if not class_value:
+        return False
+    tokens = set(class_value.split()) if isinstance(class_value, str) else set(class_value)
+    return POST_MESSAGE_CLASSES <= tokens or 'date' in tokens
+
+# Restrict last post page parsing to the post messages and their dates, wherever the date sits relative to its message
+POST_MESSAGE_STRAINER = SoupStrainer('div', class_=is_post_message_or_date)
+
 # Function to scrape the last post which is not exposed through API
-async def fetch_last_post(session, thread_url):
+async def fetch_last_post(session, thread_url, semaphore):
     last_post_url = f"{thread_url}&goto=lastpost"
     log_print(f"Fetching last post from {last_post_url}", VERBOSE)
     
     for attempt in range(retry_limit):
         try:
-            async with session.get(last_post_url) as response:
+            # Hold a request slot only while the request is in flight, never while waiting to retry
+            async with semaphore, session.get(last_post_url) as response:
                 if response.status != 200:
                     log_print(f"Failed to fetch {last_post_url} with status code: {response.status}", logging.INFO)
                     return None
                 
                 text = await response.text()
-                soup = BeautifulSoup(text, 'html.parser')
+                # Only build the tree for the post messages and date divs, which hold the poster and the post date
+                soup = BeautifulSoup(text, html_parser, parse_only=POST_MESSAGE_STRAINER)
                 
                 last_post_div = soup.find('div', class_='forum-topic-message message individual')
                 if not last_post_div:
@@ -646,11 +748,11 @@ async def fetch_last_post(session, thread_url):
                 
                 username = last_post_div.get('data-user')
                 timestamp_div = last_post_div.find_next('div', class_='date')
-                timestamp_unix = int(timestamp_div.get('data-time'))
-                timestamp = datetime.datetime.fromtimestamp(timestamp_unix, datetime.timezone.utc).astimezone(datetime.timezone(datetime.timedelta(hours=2)))
+                timestamp = int(timestamp_div.get('data-time'))
                 
-                last_post_details = {'username': username, 'timestamp': timestamp.isoformat()}
-                log_print(f"Last post details for {last_post_url}: {last_post_details}", logging.DEBUG)
+                last_post_details = {'username': username, 'timestamp': timestamp}
+                if verbosity >= 3:
+                    log_print(f"Last post details for {last_post_url}: {last_post_details}", logging.DEBUG)
                 return last_post_details
         except Exception as e:
             if attempt == retry_limit - 1:
@@ -658,58 +760,68 @@ async def fetch_last_post(session, thread_url):
                 return None
             await asyncio.sleep(sleep_time)
 
-async def fetch_forum_data(anime_ids):
-    async with get_session() as session:
-        # Fetch all forum threads
-        thread_results = await asyncio.gather(*[fetch_forum_threads(session, anime_id) for anime_id in anime_ids])
-        all_thread_data = [thread for result in thread_results if result is not None for thread in result]
-        
-        if not all_thread_data:
-            log_print("No thread data found for any anime.", logging.INFO)
-            return []
-        else:
-            log_print(f"Total threads found: {len(all_thread_data)}", logging.DEBUG)
+# Fetch forum threads, their posts and last posts for all anime IDs using the provided session
+async def fetch_forum_data(session, anime_ids, semaphore):
+    # Fetch all forum threads
+    thread_results = await asyncio.gather(*[fetch_forum_threads(session, anime_id, semaphore) for anime_id in anime_ids])
+    all_thread_data = [thread for result in thread_results if result is not None for thread in result]
+    
+    if not all_thread_data:
+        log_print("No thread data found for any anime.", logging.INFO)
+        return []
+    else:
+        log_print(f"Total threads found: {len(all_thread_data)}", logging.DEBUG)
+        if verbosity >= 3:
             for thread in all_thread_data:
                 log_print(f"Thread data: {thread}", logging.DEBUG)
-        
-        # Fetch all thread details and last posts concurrently
-        detail_tasks = [fetch_thread_details(session, thread['thread_url'].split('=')[-1]) for thread in all_thread_data]
-        last_post_tasks = [fetch_last_post(session, thread['thread_url']) for thread in all_thread_data]
-        
-        all_results = await asyncio.gather(*detail_tasks, *last_post_tasks)
-        
-        detail_results = all_results[:len(detail_tasks)]
-        last_post_results = all_results[len(detail_tasks):]
-
-        for thread, details, last_post in zip(all_thread_data, detail_results, last_post_results):
-            thread['details'] = details
-            if last_post:
-                thread['details'].append(last_post)
-
-        # Collect everything we've gathered into a dictionary
-        anime_thread_data = []
-        for anime_id in anime_ids:
-            anime_data = {
-                'anime_id': anime_id,
-                'threads': []
-            }
-            for thread in all_thread_data:
-                if thread['anime_id'] == anime_id:
-                    unique_posters = set(detail['username'] for detail in thread['details'])
-                    thread['unique_posters'] = unique_posters
-                    anime_data['threads'].append(thread)
-            anime_thread_data.append(anime_data)
+    
+    # Fetch the details and last post of a single thread together
+    async def fetch_thread(thread):
+        return await asyncio.gather(fetch_thread_details(session, thread['topicid'], semaphore), fetch_last_post(session, thread['thread_url'], semaphore))
+
+    # Fetch all threads concurrently, one task per thread
+    post_results = await asyncio.gather(*[fetch_thread(thread) for thread in all_thread_data])
+
+    for thread, (details, last_post) in zip(all_thread_data, post_results):
+        thread['details'] = details
+        if last_post:
+            thread['details'].append(last_post)
+
+    # Group the threads by anime ID in a single pass
+    threads_by_anime = defaultdict(list)
+    for thread in all_thread_data:
+        thread['unique_posters'] = set(detail['username'] for detail in thread['details'])
+        threads_by_anime[thread['anime_id']].append(thread)
+
+    # Collect everything we've gathered into a dictionary
+    anime_thread_data = []
+    for anime_id in anime_ids:
+        anime_data = {
+            'anime_id': anime_id,
+            'threads': threads_by_anime.get(anime_id, [])
+        }
+        anime_thread_data.append(anime_data)
 
-        return anime_thread_data
+    return anime_thread_data
 
 # Function to create and populate the posts sheet if we're fetching forum data
 def create_posts_sheet(wb, data, titles):
     ws = wb.create_sheet(title="posts")
     post_counts = {}
+    # Column settings must be in place before the first row is written
+    ws.column_dimensions['A'].width = 2 * ws.column_dimensions['A'].width
+
+    # Apply number format only to the user post counts
+    def count_cell(value):
+        cell = WriteOnlyCell(ws, value=value)
+        cell.number_format = numbers.FORMAT_NUMBER
+        return cell
 
     # Add the first heading
-    ws.append(["Total number of unique posters in episode discussion threads"])
-    ws.cell(row=1, column=1).font = Font(size=18)
+    heading_cell = WriteOnlyCell(ws, value="Total number of unique posters in episode discussion threads")
+    heading_cell.font = HEADING
+    # Build every row in memory and append them all in one pass at the end; the row count doubles as the current row number
+    rows = [[heading_cell]]
 
     # Put the post summary
     all_episode_numbers = sorted(set(
@@ -717,12 +829,16 @@ def create_posts_sheet(wb, data, titles):
         for anime_data in data
         for thread in anime_data['threads']
     ))
-    header = ["Title"] + [f"EP{ep}" for ep in all_episode_numbers]
-    ws.append(header)
-
-    for cell in ws[2]:
-        cell.font = Font(bold=True)
-        cell.alignment = Alignment(horizontal='center')
+    header = []
+    for value in ["Title"] + [f"EP{ep}" for ep in all_episode_numbers]:
+        cell = WriteOnlyCell(ws, value=value)
+        cell.font = BOLD
+        cell.alignment = CENTER
+        header.append(cell)
+    rows.append(header)
+
+    # For week 2, count all posts made before its end; otherwise only posts made within the current period
+    period_start_ts = 0 if current_period == 2 else current_period_start_ts
     
     for anime_data in data:
         anime_id = anime_data['anime_id']
@@ -732,40 +848,31 @@ def create_posts_sheet(wb, data, titles):
         episode_dict = {thread['episode_number']: len(thread['unique_posters']) for thread in anime_data['threads']}
         for ep in all_episode_numbers:
             row.append(episode_dict.get(ep, 0))
-        ws.append(row)
+        if len(row) > 1:
+            row[1] = count_cell(row[1])
+        rows.append(row)
 
         # Calculate unique posters
         total_posts = 0
         for thread in anime_data['threads']:
-            log_print(f"Processing thread for EP{thread['episode_number']}", logging.DEBUG)
-            thread_posters = set()
-            for detail in thread['details']:
-                timestamp = datetime.datetime.fromisoformat(detail['timestamp'])
-                log_print(f"Post timestamp: {timestamp}", logging.DEBUG)
-                # For week 2, count all posts made before its end
-                if current_period == 2:
-                    if timestamp < current_period_end:
-                        thread_posters.add(detail['username'])
-                        log_print(f"Added poster {detail['username']} to thread set", logging.DEBUG)
-                else:
-                    if current_period_start <= timestamp < current_period_end:
-                        thread_posters.add(detail['username'])
-                        log_print(f"Added poster {detail['username']} to thread set", logging.DEBUG)
+            thread_posters = {detail['username'] for detail in thread['details'] if period_start_ts <= detail['timestamp'] < current_period_end_ts}
             
             # Sum up unique posts for each thread
             total_posts += len(thread_posters)
-            log_print(f"Unique posters in thread for EP{thread['episode_number']}: {len(thread_posters)}", logging.DEBUG)
+            if verbosity >= 3:
+                log_print(f"Unique posters in thread for EP{thread['episode_number']}: {len(thread_posters)}", logging.DEBUG)
         
         # Sum up unique posts across all threads keyed to the anime ID
         post_counts[anime_id] = total_posts
         log_print(f"Total posts for {title}: {post_counts[anime_id]}", logging.DEBUG)
 
     # Add second heading before the thread breakdown
-    ws.append([])
-    ws.append(["Unique poster breakdown per thread (name, number of posts, date of first post)"])
-    ws.cell(row=ws.max_row, column=1).font = Font(size=18)
+    rows.append([])
+    heading_cell = WriteOnlyCell(ws, value="Unique poster breakdown per thread (name, number of posts, date of first post)")
+    heading_cell.font = HEADING
+    rows.append([heading_cell])
     
-    breakdown_start_row = ws.max_row + 1  # Remember where the breakdown starts
+    breakdown_start_row = len(rows) + 1  # Remember where the breakdown starts
     
     for anime_data in data:
         anime_id = anime_data['anime_id']
@@ -774,39 +881,37 @@ def create_posts_sheet(wb, data, titles):
         # Define the structure for per-episode breakdown
         for i, thread in enumerate(anime_data['threads']):
             if i > 0 or anime_data != data[0]:
-                ws.append([])
-            ws.append([title, f"EP{thread['episode_number']}", thread['thread_url']])
-            row_index = ws.max_row
-            for cell in ws[row_index]:
-                cell.font = Font(bold=True)
-            ws[row_index][1].alignment = Alignment(horizontal='center')
-            ws[row_index][2].hyperlink = thread['thread_url']
-            ws[row_index][2].style = 'Hyperlink'
+                rows.append([])
+            title_cell = WriteOnlyCell(ws, value=title)
+            title_cell.font = BOLD
+            episode_cell = WriteOnlyCell(ws, value=f"EP{thread['episode_number']}")
+            episode_cell.font = BOLD
+            episode_cell.alignment = CENTER
+            link_cell = WriteOnlyCell(ws, value=thread['thread_url'])
+            link_cell.hyperlink = thread['thread_url']
+            link_cell.style = 'Hyperlink'
+            rows.append([title_cell, episode_cell, link_cell])
             
-            user_posts = defaultdict(lambda: {'count': 0, 'first_post': None})
+            # Count posts per user and note the date of each user's first post
+            post_totals = {}
+            first_posts = {}
             for detail in thread['details']:
                 username = detail['username']
-                timestamp = datetime.datetime.fromisoformat(detail['timestamp'])
-                user_posts[username]['count'] += 1
-                if not user_posts[username]['first_post']:
-                    user_posts[username]['first_post'] = timestamp.strftime('%Y-%m-%d %H:%M')
+                post_totals[username] = post_totals.get(username, 0) + 1
+                if username not in first_posts:
+                    first_posts[username] = datetime.datetime.fromtimestamp(detail['timestamp'], FAL_TZ).strftime('%Y-%m-%d %H:%M')
             
             # Sort the user list by total post counts, then first post date
-            sorted_user_posts = sorted(user_posts.items(), key=lambda x: x[1]['count'], reverse=True)
-            for username, info in sorted_user_posts:
-                ws.append([username, info['count'], info['first_post']])
-        
-    ws.column_dimensions['A'].width = 2 * ws.column_dimensions['A'].width
+            sorted_user_posts = sorted(post_totals.items(), key=lambda x: x[1], reverse=True)
+            for username, count in sorted_user_posts:
+                rows.append([username, count_cell(count), first_posts[username]])
 
-    # Apply number format only to the user post counts
-    for row in ws.iter_rows(min_row=2, max_row=ws.max_row, min_col=2, max_col=2):
-        for cell in row:
-            if isinstance(cell.value, int):
-                cell.number_format = numbers.FORMAT_NUMBER
+    for row in rows:
+        ws.append(row)
 
     # Apply gradient conditional formatting to user post counts if they exist
-    if ws.max_row > breakdown_start_row:
-        last_data_row = ws.max_row
+    if len(rows) > breakdown_start_row:
+        last_data_row = len(rows)
         color_rule_posts = ColorScaleRule(
             start_type='num', start_value=1, start_color='209020',  # Forest green
             mid_type='num', mid_value=5, mid_color='F0F050',  # Starship yellow
@@ -818,18 +923,19 @@ def create_posts_sheet(wb, data, titles):
         log_print("No data to apply conditional formatting in the posts sheet.", logging.WARNING)
     return post_counts
 
-# Add text summary displaying internal timestamps below data rows
-main_sheet.append([])
-main_sheet.append([
-    f"Current season: {current_season} {now.year}, data retrieved on {now.strftime('%Y-%m-%d %H:%M')} (FAL timezone)."
-])
-main_sheet.append([
-    f"Retrieval week: {current_week}, post counting period: week {current_period}."
-])
+# Run the asynchronous fetching for primary and secondary lists and forum data, document the action
+log_print("Fetching API data...", logging.INFO)
+datas, secondary_datas, forum_data = asyncio.run(main(anime_ids, secondary_anime_ids))
+# Only dump the fetched data at debug verbosity, where it actually gets printed
+if verbosity >= 3:
+    log_print(datas, logging.DEBUG)
+failed_anime_ids.extend([anime_id for anime_id in anime_ids if anime_id not in datas])
+if secondary_anime_ids and verbosity >= 3:
+    log_print(secondary_datas, logging.DEBUG)
 
-# Fetch and integrate forum data into the workbook if enabled
+# Build the posts sheet first if enabled, since the main sheet needs the post counts as its rows are written
+post_counts = {}
 if enable_posts:
-    forum_data = asyncio.run(fetch_forum_data(anime_ids))
     anime_titles = {}
     for anime_id in anime_ids:  # Use the original list of anime IDs
         data = datas.get(anime_id)
@@ -839,15 +945,35 @@ if enable_posts:
             log_print(f"Warning: Missing or invalid data for anime ID {anime_id}", logging.WARNING)
             anime_titles[anime_id] = f"Unknown (ID: {anime_id})"
     post_counts = create_posts_sheet(workbook, forum_data, anime_titles)
+    if verbosity >= 3:
+        log_print(f"Post counts: {post_counts}", logging.DEBUG)
+
+# Sort the data before populating the sheet
+sorted_datas = sort_data(datas, sort_column)
 
-    log_print("\nPopulating Posts column", VERBOSE)
-    main_sheet = workbook['main']
-    for row in main_sheet.iter_rows(min_row=2, max_row=len(datas) + 1, min_col=4, max_col=4):
-        cell = row[0]
-        anime_id = main_sheet.cell(row=cell.row, column=13).value
-        post_count = post_counts.get(anime_id, 0)
-        log_print(f"Anime ID: {anime_id}, Post count: {post_count}", logging.DEBUG)
-        cell.value = post_counts.get(anime_id, 0)    
+# Populate the main sheet
+log_print("Populating the spreadsheet...", logging.INFO)
+populate_sheet(main_sheet, sorted_datas, post_counts)
+# Populate the secondary sheet if secondary IDs are provided
+if secondary_anime_ids:
+    secondary_datas = sort_data(secondary_datas, sort_column)
+    populate_sheet(alt_sheet, secondary_datas, {})
+# The cached variables are no longer needed once every sheet is written
+calculated_variables.clear()
+
+# Apply conditional formatting to relevant sheets
+apply_conditional_formatting(main_sheet, len(sorted_datas))
+if secondary_datas:
+    apply_conditional_formatting(alt_sheet, len(secondary_datas))
+
+# Add text summary displaying internal timestamps below data rows
+main_sheet.append([])
+main_sheet.append([
+    f"Current season: {current_season} {now.year}, data retrieved on {now.strftime('%Y-%m-%d %H:%M')} (FAL timezone)."
+])
+main_sheet.append([
+    f"Retrieval week: {current_week}, post counting period: week {current_period}."
+])
 
 # Timestamp output filename to identify data and avoid accidental overwrites
 now = datetime.datetime.now()